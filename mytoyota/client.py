@@ -69,17 +69,22 @@ class MyT:
     @staticmethod
     def get_supported_regions() -> list:
         """Return supported regions"""
-        regions = []
-
-        for key, _ in SUPPORTED_REGIONS.items():  # pylint: disable=unused-variable
-            regions.append(key)
-
-        return regions
+        return list(SUPPORTED_REGIONS)
 
     async def login(self) -> None:
         """Login to Toyota services"""
         await self.api.controller.first_login()
 
+    async def close(self) -> None:
+        """Close the connection to Toyota services"""
+        await self.api.controller.close()
+
+    async def __aenter__(self) -> "MyT":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def get_uuid(self) -> str:
         """Get uuid"""
         return await self.api.uuid()
@@ -128,6 +133,14 @@ class MyT:
 
         return car
 
+    async def get_vehicles_status(self, vehicles: list) -> list:
+        """Return information for all given vehicles, fetched concurrently"""
+        return list(
+            await asyncio.gather(
+                *[self.get_vehicle_status(vehicle) for vehicle in vehicles]
+            )
+        )
+
     async def get_vehicle_status_json(self, vehicle: dict) -> str:
         """Return vehicle information as json"""
         vehicle = await self.get_vehicle_status(vehicle)
@@ -162,30 +175,33 @@ class MyT:
 
         stats_interval = interval
 
-        if from_date is not None and arrow.get(from_date) > arrow.now():
+        # Use the same point in time for every date calculation below.
+        now = arrow.now()
+
+        if from_date is not None and arrow.get(from_date) > now:
             return [{"error_mesg": "This is not a timemachine!", "error_code": 5}]
 
         if from_date is None:
             if interval is DAY:
-                from_date = arrow.now().shift(days=-1).format(DATE_FORMAT)
+                from_date = now.shift(days=-1).format(DATE_FORMAT)
 
             if interval is WEEK:
-                from_date = arrow.now().span(WEEK, week_start=7)[0].format(DATE_FORMAT)
+                from_date = now.span(WEEK, week_start=7)[0].format(DATE_FORMAT)
 
             if interval is ISOWEEK:
                 stats_interval = DAY
-                from_date = arrow.now().floor(WEEK).format(DATE_FORMAT)
+                from_date = now.floor(WEEK).format(DATE_FORMAT)
 
             if interval is MONTH:
-                from_date = arrow.now().floor(MONTH).format(DATE_FORMAT)
+                from_date = now.floor(MONTH).format(DATE_FORMAT)
 
             if interval is YEAR:
                 stats_interval = MONTH
-                from_date = arrow.now().floor(YEAR).format(DATE_FORMAT)
+                from_date = now.floor(YEAR).format(DATE_FORMAT)
 
         if interval is ISOWEEK:
             stats_interval = DAY
-            time_between = arrow.now() - arrow.get(from_date)
+            time_between = now - arrow.get(from_date)
 
             if time_between.days > 7:
                 return [
@@ -201,7 +217,7 @@ class MyT:
         if interval is YEAR:
             stats_interval = MONTH
 
-            if arrow.get(from_date) < arrow.now().floor(YEAR):
+            if arrow.get(from_date) < now.floor(YEAR):
                 return [
                     {
                         "error_mesg": "Invalid date provided. from_date can"
@@ -212,7 +228,7 @@ class MyT:
 
             from_date = arrow.get(from_date).floor(YEAR).format(DATE_FORMAT)
 
-        today = arrow.now().format(DATE_FORMAT)
+        today = now.format(DATE_FORMAT)
 
         if from_date == today:
             raw_statistics = None
@@ -22,6 +22,8 @@ PASSWORD = "password"
 
 # So we don't have to test the token if multiple endpoints is requested at the same time.
 TOKEN_DURATION = 900
+# Check the token this many seconds before TOKEN_DURATION runs out.
+TOKEN_REFRESH_MARGIN = 60
 TOKEN_LENGTH = 114
 
 # JSON ATTRIBUTES
@@ -74,6 +76,11 @@ DATE_FORMAT = "YYYY-MM-DD"
 
 # HTTP
 TIMEOUT = 15
+MAX_CONCURRENT_REQUESTS = 8
+# Identical GET requests within this many seconds are answered from memory.
+RESPONSE_CACHE_DURATION = 2
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
 
 HTTP_OK = 200
 HTTP_NO_CONTENT = 204
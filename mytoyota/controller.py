@@ -1,6 +1,9 @@
 """Toyota Connected Services Controller """
 
+import asyncio
+from copy import deepcopy
 from datetime import datetime
+from importlib.util import find_spec
 import logging
 from typing import Optional, Union
 
@@ -14,11 +17,16 @@ from mytoyota.const import (
     HTTP_NO_CONTENT,
     HTTP_OK,
     HTTP_SERVICE_UNAVAILABLE,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
     PASSWORD,
+    RESPONSE_CACHE_DURATION,
     SUPPORTED_REGIONS,
     TIMEOUT,
     TOKEN,
     TOKEN_DURATION,
+    TOKEN_REFRESH_MARGIN,
     TOKEN_VALID_URL,
     USERNAME,
     UUID,
@@ -26,14 +34,26 @@ from mytoyota.const import (
 from mytoyota.exceptions import ToyotaApiError, ToyotaInternalError, ToyotaLoginError
 from mytoyota.utils import is_valid_token
 
+try:
+    # orjson parses responses considerably faster, use it when it is installed.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
-class Controller:
+class Controller:  # pylint: disable=too-many-instance-attributes
     """Httpx async client controller class"""
 
     _token: str = None
     _token_expiration: datetime = None
+    _client: Optional[httpx.AsyncClient] = None
+    _refresh_handle: Optional[asyncio.TimerHandle] = None
+    _refresh_task: Optional[asyncio.Task] = None
+    _last_request: Optional[datetime] = None
+    _request_semaphore: Optional[asyncio.Semaphore] = None
+    _token_lock: Optional[asyncio.Lock] = None
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -45,9 +65,18 @@ class Controller:
     ) -> None:
         self._locale = locale
         self._region = region
+        self._region_urls = SUPPORTED_REGIONS[region]
         self._username = username
         self._password = password
         self._uuid = uuid
+        self._static_headers = {
+            **BASE_HEADERS,
+            "X-TME-LC": locale,
+            "X-TME-LOCALE": locale,
+        }
+        self._response_cache: dict = {}
+        # Bumped by every mutating request, see request().
+        self._cache_generation = 0
 
     def _build_auth_body(self) -> dict:
         """Return auth body in a dict"""
@@ -55,19 +84,71 @@ class Controller:
 
     def _get_auth_endpoint(self) -> str:
         """Returns auth endpoint"""
-        return SUPPORTED_REGIONS[self._region][ENDPOINT_AUTH]
+        return self._region_urls[ENDPOINT_AUTH]
 
     def _get_auth_valid_endpoint(self) -> str:
         """Returns token is valid endpoint"""
-        return SUPPORTED_REGIONS[self._region][TOKEN_VALID_URL]
+        return self._region_urls[TOKEN_VALID_URL]
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the shared httpx client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=TIMEOUT,
+                # HTTP/2 lets concurrent requests share one connection,
+                # httpx only supports it when the h2 package is installed.
+                http2=find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        """Returns the semaphore that bounds concurrent API requests"""
+        if self._request_semaphore is None:
+            # Created on first use so it belongs to the running event loop.
+            self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return self._request_semaphore
+
+    def _get_token_lock(self) -> asyncio.Lock:
+        """Returns the lock that serializes token checks and logins"""
+        if self._token_lock is None:
+            # Created on first use so it belongs to the running event loop.
+            self._token_lock = asyncio.Lock()
+        return self._token_lock
+
+    async def close(self) -> None:
+        """Closes the shared httpx client and its pooled connections"""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        # Recreated on next use, so a reused controller binds to the new loop.
+        self._request_semaphore = None
+        self._token_lock = None
 
     async def get_uuid(self) -> str:
         """Returns uuid"""
         return self._uuid
 
     async def first_login(self) -> None:
-        """Perform first login"""
-        await self._update_token()
+        """Perform first login, reusing the current token if it is still valid"""
+        async with self._get_token_lock():
+            if self._should_check_token():
+                await self._check_token()
+
+    def _should_check_token(self) -> bool:
+        """Checks if there is no token or it has not been checked for TOKEN_DURATION"""
+        return not self._token or self._has_expired(
+            self._token_expiration, TOKEN_DURATION
+        )
 
     @staticmethod
     def _has_expired(creation_dt: datetime, duration: int) -> bool:
@@ -79,46 +160,132 @@ class Controller:
 
         # Cannot authenticate with aiohttp (returns 415),
         # but it works with httpx.
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self._get_auth_endpoint(),
-                headers={"X-TME-LC": self._locale},
-                json=self._build_auth_body(),
-            )
-            if response.status_code == HTTP_OK:
-                result = response.json()
+        response = await self._get_client().post(
+            self._get_auth_endpoint(),
+            headers={"X-TME-LC": self._locale},
+            json=self._build_auth_body(),
+            # A successful login answers directly, a redirect means it failed.
+            allow_redirects=False,
+        )
+        if response.status_code == HTTP_OK:
+            result = json_loads(response.content)
 
-                if TOKEN not in result or UUID not in result[CUSTOMERPROFILE]:
-                    raise ToyotaLoginError("Could not get token or UUID from result")
+            if TOKEN not in result or UUID not in result.get(CUSTOMERPROFILE, {}):
+                raise ToyotaLoginError("Could not get token or UUID from result")
 
-                token = result.get(TOKEN)
-                uuid = result[CUSTOMERPROFILE][UUID]
+            token = result.get(TOKEN)
+            uuid = result[CUSTOMERPROFILE][UUID]
 
-                if is_valid_token(token):
-                    self._uuid = uuid
-                    self._token = token
-                    self._token_expiration = datetime.now()
-            else:
-                raise ToyotaLoginError(
-                    f"Login failed, check your credentials! {response.text}"
-                )
+            if is_valid_token(token):
+                self._uuid = uuid
+                self._token = token
+                self._token_expiration = datetime.now()
+                self._start_token_refresh()
+        else:
+            raise ToyotaLoginError(
+                f"Login failed, check your credentials! {response.text}"
+            )
+
+    async def _check_token(self) -> None:
+        """Validates the token and logs in again if it is no longer accepted"""
+        if await self._is_token_valid():
+            # Token is still accepted by Toyota, so trust it for another
+            # TOKEN_DURATION instead of re-validating it on every request.
+            self._token_expiration = datetime.now()
+            # Restart the background refresh in case an earlier attempt failed.
+            self._start_token_refresh()
+        else:
+            await self._update_token()
+
+    def _start_token_refresh(self) -> None:
+        """Schedules a background token check shortly before TOKEN_DURATION runs out"""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        self._refresh_handle = asyncio.get_running_loop().call_later(
+            TOKEN_DURATION - TOKEN_REFRESH_MARGIN, self._on_token_refresh_due
+        )
+
+    def _on_token_refresh_due(self) -> None:
+        """Starts the background token check if requests were made since the last one"""
+        self._refresh_handle = None
+        if self._last_request is None or self._last_request < self._token_expiration:
+            # Idle since the token was last checked, so don't keep polling
+            # Toyota. The next request checks the token itself.
+            return
+        self._refresh_task = asyncio.ensure_future(self._refresh_token())
+
+    async def _refresh_token(self) -> None:
+        """Checks the token before it expires, so requests don't have to wait for it"""
+        try:
+            async with self._get_token_lock():
+                await self._check_token()
+        except Exception as ex:  # pylint: disable=broad-except
+            # Nobody awaits this task, so log whatever went wrong here.
+            # Requests fall back to checking the token themselves.
+            _LOGGER.warning("Background token refresh failed: %s", ex)
 
     async def _is_token_valid(self) -> bool:
         """Checks if token is valid"""
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self._get_auth_valid_endpoint(),
-                json={TOKEN: self._token},
-            )
-            if response.status_code == HTTP_OK:
-                result = response.json()
+        if self._token is None:
+            return False
 
-                if result["valid"]:
-                    return True
-                return False
+        response = await self._get_client().post(
+            self._get_auth_valid_endpoint(),
+            json={TOKEN: self._token},
+        )
+        if response.status_code == HTTP_OK:
+            result = json_loads(response.content)
+
+            if result["valid"]:
+                return True
+            return False
 
-            raise ToyotaLoginError(f"Error when trying to check token: {response.text}")
+        raise ToyotaLoginError(f"Error when trying to check token: {response.text}")
+
+    @staticmethod
+    def _get_cache_key(
+        method: str, url: str, params: Optional[dict], headers: Optional[dict]
+    ) -> Optional[tuple]:
+        """Returns the response cache key, None if the request must not be cached"""
+        if method != "GET":
+            return None
+        return (
+            url,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+        )
+
+    def _get_cached_response(self, key: Optional[tuple]) -> Optional[tuple]:
+        """Returns the cached (timestamp, response) entry if it has not expired"""
+        cached = self._response_cache.get(key) if key is not None else None
+        if cached is None or self._has_expired(cached[0], RESPONSE_CACHE_DURATION):
+            return None
+        return cached
+
+    def _cache_response(
+        self,
+        key: Optional[tuple],
+        generation: int,
+        result: Union[dict, list, None],
+    ) -> None:
+        """Caches a GET response, or invalidates the cache after any other request"""
+        if key is None:
+            # The request may have changed data, so cached responses are stale.
+            self._response_cache = {}
+            self._cache_generation += 1
+            return
+
+        # Don't cache data fetched before a mutating request finished.
+        if generation != self._cache_generation:
+            return
+
+        self._response_cache = {
+            cached_key: cached
+            for cached_key, cached in self._response_cache.items()
+            if not self._has_expired(cached[0], RESPONSE_CACHE_DURATION)
+        }
+        self._response_cache[key] = (datetime.now(), deepcopy(result))
 
     async def request(  # pylint: disable=too-many-arguments
         self,
@@ -131,65 +298,73 @@ class Controller:
     ) -> Union[dict, list, None]:
         """Shared request method"""
 
-        if headers is None:
-            headers = {}
-
         if method not in ("GET", "POST", "PUT", "DELETE"):
             raise ToyotaInternalError("Invalid request method provided")
 
-        if not self._token or self._has_expired(self._token_expiration, TOKEN_DURATION):
-            if not await self._is_token_valid():
-                await self._update_token()
+        self._last_request = datetime.now()
 
         if base_url:
-            url = SUPPORTED_REGIONS[self._region][base_url] + endpoint
+            url = self._region_urls[base_url] + endpoint
         else:
             url = endpoint
 
-        headers.update(
-            {
-                "X-TME-LC": self._locale,
-                "X-TME-LOCALE": self._locale,
-                "X-TME-TOKEN": self._token,
-            }
-        )
+        cache_key = self._get_cache_key(method, url, params, headers)
+        cache_generation = self._cache_generation
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            # Callers modify the returned data, so never hand out the cached object.
+            return deepcopy(cached[1])
+
+        if self._should_check_token():
+            async with self._get_token_lock():
+                # Another request may have checked the token while we waited.
+                if self._should_check_token():
+                    await self._check_token()
+
+        headers = {
+            **self._static_headers,
+            **(headers or {}),
+            "X-TME-TOKEN": self._token,
+        }
 
         if method in ("GET", "POST"):
-            headers.update(
-                {
-                    "Cookie": f"iPlanetDirectoryPro={self._token}",
-                    "uuid": self._uuid,
-                }
-            )
+            headers["Cookie"] = f"iPlanetDirectoryPro={self._token}"
+            headers["uuid"] = self._uuid
 
         # Cannot authenticate with aiohttp (returns 415),
         # but it works with httpx.
-        async with httpx.AsyncClient(headers=BASE_HEADERS, timeout=TIMEOUT) as client:
-            response = await client.request(
-                method, url, headers=headers, json=body, params=params
+        async with self._get_request_semaphore():
+            response = await self._get_client().request(
+                method,
+                url,
+                headers=headers,
+                json=body,
+                params=params,
+            )
+        if response.status_code == HTTP_OK:
+            result = json_loads(response.content)
+        elif response.status_code == HTTP_NO_CONTENT:
+            # This prevents raising or logging an error
+            # if the user have not setup Connected Services
+            result = None
+            _LOGGER.debug("Connected services is disabled")
+        elif response.status_code == HTTP_INTERNAL:
+            response = json_loads(response.content)
+            raise ToyotaInternalError(
+                "Internal server error occurred! Code: "
+                + response["code"]
+                + " - "
+                + response["message"],
+            )
+        elif response.status_code == HTTP_SERVICE_UNAVAILABLE:
+            raise ToyotaApiError(
+                "Toyota Connected Services are temporarily unavailable"
             )
-            if response.status_code == HTTP_OK:
-                result = response.json()
-            elif response.status_code == HTTP_NO_CONTENT:
-                # This prevents raising or logging an error
-                # if the user have not setup Connected Services
-                result = None
-                _LOGGER.debug("Connected services is disabled")
-            elif response.status_code == HTTP_INTERNAL:
-                response = response.json()
-                raise ToyotaInternalError(
-                    "Internal server error occurred! Code: "
-                    + response["code"]
-                    + " - "
-                    + response["message"],
-                )
-            elif response.status_code == HTTP_SERVICE_UNAVAILABLE:
-                raise ToyotaApiError(
-                    "Toyota Connected Services are temporarily unavailable"
-                )
-            else:
-                raise ToyotaInternalError(
-                    "HTTP: " + str(response.status_code) + " - " + response.text
-                )
+        else:
+            raise ToyotaInternalError(
+                "HTTP: " + str(response.status_code) + " - " + response.text
+            )
+
+        self._cache_response(cache_key, cache_generation, result)
 
         return result
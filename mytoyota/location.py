@@ -12,7 +12,7 @@ class ParkingLocation:
     timestamp: int = None
 
     def __init__(self, parking: dict) -> None:
-        _LOGGER.debug("Raw parking location data: %s", str(parking))
+        _LOGGER.debug("Raw parking location data: %s", parking)
 
         self.latitude = float(parking.get("lat", None))
         self.longitude = float(parking.get("lon", None))
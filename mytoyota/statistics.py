@@ -1,4 +1,5 @@
 """Statistics class"""
+from datetime import date, timedelta
 import logging
 
 import arrow
@@ -116,9 +117,9 @@ class Statistics:  # pylint: disable=too-few-public-methods)
                 day[BUCKET].update(
                     {
                         UNIT: METRIC,
-                        DATE: self._now.strptime(f"{dayofyear} {year}", "%j %Y").format(
-                            DATE_FORMAT
-                        ),
+                        DATE: (
+                            date(int(year), 1, 1) + timedelta(days=int(dayofyear) - 1)
+                        ).isoformat(),
                     }
                 )
             return data[HISTOGRAM]
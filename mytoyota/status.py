@@ -39,7 +39,7 @@ class Sensors:
     last_updated: str = None
 
     def __init__(self, status: dict):
-        _LOGGER.debug("Raw sensor data: %s", str(status))
+        _LOGGER.debug("Raw sensor data: %s", status)
 
         self.overallstatus = status.get("overallStatus", None)
         self.last_updated = status.get("timestamp", None)
@@ -9,6 +9,9 @@ from mytoyota.utils import format_odometer
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Vehicle info keys that are exposed as attributes and left out of details.
+_DETAILS_SKIP = frozenset(("vin", "alias", "id"))
+
 
 class VehicleStatistics:
     """Vehicle statistics representation"""
@@ -39,7 +42,7 @@ class Vehicle:  # pylint: disable=too-many-instance-attributes
     hvac: Optional[Hvac] = None
     parking: Optional[ParkingLocation] = None
     sensors: Optional[Sensors] = None
-    statistics: VehicleStatistics = VehicleStatistics()
+    statistics: Optional[VehicleStatistics] = None
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -50,39 +53,43 @@ class Vehicle:  # pylint: disable=too-many-instance-attributes
         remote_control: Optional[dict],
     ) -> None:
 
+        # Each vehicle gets its own holder, a class level default would be shared.
+        self.statistics = VehicleStatistics()
+
         # If no vehicle information is provided, abort.
         if not vehicle_info:
             _LOGGER.error("No vehicle information provided!")
             return
 
-        _LOGGER.debug("Raw connected services data: %s", str(connected_services))
-
-        if connected_services is not None:
-            self.is_connected = self._has_connected_services_enabled(connected_services)
-
-        _LOGGER.debug("Raw vehicle info: %s", str(vehicle_info))
+        _LOGGER.debug("Raw vehicle info: %s", vehicle_info)
 
         # Vehicle information
         self.id = vehicle_info.get("id", None)  # pylint: disable=invalid-name
         self.vin = vehicle_info.get("vin", None)
         self.alias = vehicle_info.get("alias", None)
 
+        _LOGGER.debug("Raw connected services data: %s", connected_services)
+
+        # Evaluated once here, after vin is set, so any error logged names the car.
+        if connected_services is not None:
+            self.is_connected = self._has_connected_services_enabled(connected_services)
+
         # Format vehicle details.
         self.details = self._format_details(vehicle_info)
 
         if self.is_connected:
 
-            _LOGGER.debug("Raw status data: %s", str(status))
+            _LOGGER.debug("Raw status data: %s", status)
 
             remote_control_info = remote_control.get("VehicleInfo", {})
 
             # Extract fuel level/Energy capacity information from status.
             if "energy" in status:
-                _LOGGER.debug("Using energy data: %s", str(status.get("energy")))
+                _LOGGER.debug("Using energy data: %s", status.get("energy"))
                 self.energy = Energy(status.get("energy"))
             # Use legacy odometer to get fuel level. Older cars still uses this.
             elif odometer:
-                _LOGGER.debug("Using legacy odometer data: %s", str(odometer))
+                _LOGGER.debug("Using legacy odometer data: %s", odometer)
                 self.energy = Energy(format_odometer(odometer), True)
                 fueltype = self.details.get("fuel", "Unknown")
                 # PATCH: Toyota Aygo reports wrong type.
@@ -162,9 +169,4 @@ class Vehicle:  # pylint: disable=too-many-instance-attributes
     @staticmethod
     def _format_details(raw: dict) -> dict:
         """Formats vehicle info into a dict."""
-        details: dict = {}
-        for item in sorted(raw):
-            if item in ("vin", "alias", "id"):
-                continue
-            details[item] = raw[item]
-        return details
+        return {key: value for key, value in raw.items() if key not in _DETAILS_SKIP}